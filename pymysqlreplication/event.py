@@ -1,7 +1,8 @@
-import binascii
 import struct
+import sys
 import datetime
 import decimal
+import functools
 import zlib
 
 from pymysqlreplication.constants.STATUS_VAR_KEY import *
@@ -9,8 +10,80 @@ from pymysqlreplication.exceptions import StatusVariableMismatch
 from pymysqlreplication.util.bytes import parse_decimal_from_bytes
 from typing import Union, Optional
 
+# bound once, these are called for every event
+_utcfromtimestamp = datetime.datetime.utcfromtimestamp
+_crc32 = zlib.crc32
+
+# commit_flag, sid, gno, lt_type
+_GTID_HEADER = struct.Struct("<B16sQB")
+# same, followed by the last_committed and sequence_number of 5.7+
+_GTID_HEADER_LOGICAL_CLOCK = struct.Struct("<B16sQBQQ")
+# slave_proxy_id, execution_time, schema_length, error_code, status_vars_length
+_QUERY_POST_HEADER = struct.Struct("<IIBHH")
+# query post-header, then file_id, start_pos, end_pos, dup_handling_flags
+_EXECUTE_LOAD_QUERY_POST_HEADER = struct.Struct("<IIBHHIIIB")
+# one_phase, formatID, gtrid_length, bqual_length
+_XA_PREPARE_HEADER = struct.Struct("<BIII")
+# sid, n_intervals of a PreviousGtidsEvent entry
+_SID_HEADER = struct.Struct("<16sQ")
+# start, end of a GTID interval
+_INTERVAL = struct.Struct("<qQ")
+# gtid_seq_no, domain_id, flags of a MariaDB GTID event
+_MARIADB_GTID_HEADER = struct.Struct("<QIB")
+# type, value of an INTVAR event
+_INTVAR = struct.Struct("<BI")
+# type, charset, value_len of a non NULL user variable
+_USER_VAR_VALUE_HEADER = struct.Struct("<BII")
+# domain_id, server_id, gtid_seq_no of a MariaDB GTID list element
+_GTID_LIST_ELEMENT = struct.Struct("<IIQ")
+# seed1, seed2 of a RAND() call
+_RAND_SEEDS = struct.Struct("<QQ")
+# scheme, key_version, nonce of a MariaDB START_ENCRYPTION event
+_START_ENCRYPTION = struct.Struct("<BI12s")
+# 6 bytes table id, as low 4 bytes and high 2 bytes
+_TABLE_ID = struct.Struct("<IH")
+_UINT32 = struct.Struct("<I")
+_UINT64 = struct.Struct("<Q")
+_INT64 = struct.Struct("<q")
+_DOUBLE = struct.Struct("<d")
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_mysql_version(version_str):
+    """Parse a server version such as "8.0.34-log" into (8, 0, 34)
+
+    Every binlog file starts with a FormatDescriptionEvent carrying the same
+    few server versions, so the parsed tuples are cached.
+    """
+    numbers = version_str.split("-")[0]
+    return tuple(map(int, numbers.split(".")))
+
+
+def _format_uuid(sid):
+    """Format a 16 bytes binary SID as a dashed UUID string"""
+    nibbles = sid.hex()
+    return (
+        f"{nibbles[:8]}-{nibbles[8:12]}-{nibbles[12:16]}-"
+        f"{nibbles[16:20]}-{nibbles[20:]}"
+    )
+
 
 class BinLogEvent(object):
+    __slots__ = (
+        "packet",
+        "table_map",
+        "event_type",
+        "timestamp",
+        "event_size",
+        "_ctl_connection",
+        "mysql_version",
+        "_ignore_decode_errors",
+        "_verify_checksum",
+        "_is_event_valid",
+        "_processed",
+        "complete",
+    )
+
     def __init__(
         self,
         from_packet,
@@ -45,28 +118,28 @@ class BinLogEvent(object):
 
     def _read_table_id(self):
         # Table ID is 6 byte
-        # pad little-endian number
-        table_id = self.packet.read(6) + b"\x00\x00"
-        return struct.unpack("<Q", table_id)[0]
+        low, high = self.packet.unpack_from(_TABLE_ID)
+        return low + (high << 32)
 
     def _verify_event(self):
         if not self._verify_checksum:
             return
 
-        self.packet.rewind(1)
-        data = self.packet.read(19 + self.event_size)
-        footer = self.packet.read(4)
-        byte_data = zlib.crc32(data).to_bytes(4, byteorder="little")
-        self._is_event_valid = True if byte_data == footer else False
-        self.packet.read_bytes -= 19 + self.event_size + 4
-        self.packet.rewind(20)
+        # header and body follow the OK byte, the checksum comes right after
+        # them; compute it in place without moving the packet cursor
+        data = self.packet.packet._data
+        end = 20 + self.event_size
+        (footer,) = _UINT32.unpack_from(data, end)
+        self._is_event_valid = _crc32(memoryview(data)[1:end]) == footer
 
     def dump(self):
-        print(f"=== {self.__class__.__name__} ===")
-        print(f"Date: {datetime.datetime.utcfromtimestamp(self.timestamp).isoformat()}")
-        print(f"Log position: {self.packet.log_pos}")
-        print(f"Event size: {self.event_size}")
-        print(f"Read bytes: {self.packet.read_bytes}")
+        print(
+            f"=== {self.__class__.__name__} ===\n"
+            f"Date: {_utcfromtimestamp(self.timestamp).isoformat()}\n"
+            f"Log position: {self.packet.log_pos}\n"
+            f"Event size: {self.event_size}\n"
+            f"Read bytes: {self.packet.read_bytes}"
+        )
         self._dump()
         print()
 
@@ -86,21 +159,41 @@ class GtidEvent(BinLogEvent):
     :ivar sid: 16 byte sequence - UUID representing the SID
     :ivar gno: int - Group number, second component of GTID.
     :ivar lt_type: int(1 byte) - The type of logical timestamp used in the logical clock fields.
-    :ivar last_committed: Store the transaction's commit parent sequence_number
-    :ivar sequence_number: The transaction's logical timestamp assigned at prepare phase
+    :ivar last_committed: Store the transaction's commit parent sequence_number, None before MySQL 5.7
+    :ivar sequence_number: The transaction's logical timestamp assigned at prepare phase, None before MySQL 5.7
     """
 
+    __slots__ = (
+        "sid",
+        "gno",
+        "lt_type",
+        "commit_flag",
+        "last_committed",
+        "sequence_number",
+        "_gtid",
+    )
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
 
-        self.commit_flag = struct.unpack("!B", self.packet.read(1))[0] == 1
-        self.sid = self.packet.read(16)
-        self.gno = struct.unpack("<Q", self.packet.read(8))[0]
-        self.lt_type = self.packet.read(1)[0]
-
+        # the version is compared once to pick the whole fixed layout
         if self.mysql_version >= (5, 7):
-            self.last_committed = struct.unpack("<Q", self.packet.read(8))[0]
-            self.sequence_number = struct.unpack("<Q", self.packet.read(8))[0]
+            (
+                commit_flag,
+                self.sid,
+                self.gno,
+                self.lt_type,
+                self.last_committed,
+                self.sequence_number,
+            ) = self.packet.unpack_from(_GTID_HEADER_LOGICAL_CLOCK)
+        else:
+            commit_flag, self.sid, self.gno, self.lt_type = self.packet.unpack_from(
+                _GTID_HEADER
+            )
+            # no logical clock before 5.7
+            self.last_committed = None
+            self.sequence_number = None
+        self.commit_flag = commit_flag == 1
 
     @property
     def gtid(self):
@@ -108,23 +201,21 @@ class GtidEvent(BinLogEvent):
         GTID = source_id:transaction_id
         Eg: 3E11FA47-71CA-11E1-9E33-C80AA9429562:23
         See: http://dev.mysql.com/doc/refman/5.6/en/replication-gtids-concepts.html"""
-        nibbles = binascii.hexlify(self.sid).decode("ascii")
-        gtid = (
-            f"{nibbles[:8]}-"
-            f"{nibbles[8:12]}-"
-            f"{nibbles[12:16]}-"
-            f"{nibbles[16:20]}-"
-            f"{nibbles[20:]}:"
-            f"{self.gno}"
-        )
-        return gtid
+        # sid and gno never change once parsed, so format only once
+        try:
+            return self._gtid
+        except AttributeError:
+            pass
+        self._gtid = f"{_format_uuid(self.sid)}:{self.gno}"
+        return self._gtid
 
     def _dump(self):
-        print(f"Commit: {self.commit_flag}")
-        print(f"GTID_NEXT: {self.gtid}")
-        if hasattr(self, "last_committed"):
-            print(f"last_committed: {self.last_committed}")
-            print(f"sequence_number: {self.sequence_number}")
+        print(f"Commit: {self.commit_flag}\nGTID_NEXT: {self.gtid}")
+        if self.last_committed is not None:
+            print(
+                f"last_committed: {self.last_committed}\n"
+                f"sequence_number: {self.sequence_number}"
+            )
 
     def __repr__(self):
         return f'<GtidEvent "{self.gtid}">'
@@ -140,33 +231,34 @@ class PreviousGtidsEvent(BinLogEvent):
     Eg: [4c9e3dfc-9d25-11e9-8d2e-0242ac1cfd7e:1-100, 4c9e3dfc-9d25-11e9-8d2e-0242ac1cfd7e:1-10:20-30]
     """
 
+    __slots__ = ("_n_sid", "_previous_gtids")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super(PreviousGtidsEvent, self).__init__(
             from_packet, event_size, table_map, ctl_connection, **kwargs
         )
 
-        self._n_sid = self.packet.read_int64()
-        self._gtids = []
-
+        packet = self.packet
+        self._n_sid = packet.read_int64()
+        # every SID and interval is written as one piece of the final string
+        parts = []
         for _ in range(self._n_sid):
-            sid = self.packet.read(16)
-            n_intervals = self.packet.read_uint64()
-            intervals = [
-                f"{self.packet.read_int64()}-{self.packet.read_uint64()}"
-                for _ in range(n_intervals)
-            ]
-            nibbles = binascii.hexlify(sid).decode("ascii")
-            gtid = (
-                f"{nibbles[:8]}-"
-                f"{nibbles[8:12]}-"
-                f"{nibbles[12:16]}-"
-                f"{nibbles[16:20]}-"
-                f"{nibbles[20:]}-"
-                f":{intervals}"
-            )
-            self._gtids.append(gtid)
+            if parts:
+                parts.append(",")
+            sid, n_intervals = packet.unpack_from(_SID_HEADER)
+            parts.append(_format_uuid(sid))
+            # intervals are contiguous (start, end) pairs, decoded in one pass;
+            # end is exclusive on the wire, as in Gtid.decode, and a single
+            # transaction is written as just its number, like MySQL does
+            for start, end in _INTERVAL.iter_unpack(
+                packet.read_view(n_intervals * _INTERVAL.size)
+            ):
+                if end - 1 == start:
+                    parts.append(f":{start}")
+                else:
+                    parts.append(f":{start}-{end - 1}")
 
-        self._previous_gtids = ",".join(self._gtids)
+        self._previous_gtids = "".join(parts)
 
     def _dump(self):
         print(f"previous_gtids: {self._previous_gtids}")
@@ -188,19 +280,21 @@ class MariadbGtidEvent(BinLogEvent):
     :ivar gtid: str - The Global Transaction Identifier in the format ‘domain_id-server_id-gtid_seq_no’.
     """
 
+    __slots__ = ("server_id", "gtid_seq_no", "domain_id", "flags", "gtid")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
 
-        self.server_id = self.packet.server_id
-        self.gtid_seq_no = self.packet.read_uint64()
-        self.domain_id = self.packet.read_uint32()
-        self.flags = self.packet.read_uint8()
+        packet = self.packet
+        self.server_id = packet.server_id
+        self.gtid_seq_no, self.domain_id, self.flags = packet.unpack_from(
+            _MARIADB_GTID_HEADER
+        )
         self.gtid = f"{self.domain_id}-{self.server_id}-{self.gtid_seq_no}"
 
     def _dump(self):
         super()._dump()
-        print(f"Flags: {self.flags}")
-        print(f"GTID: {self.gtid}")
+        print(f"Flags: {self.flags}\nGTID: {self.gtid}")
 
 
 class MariadbBinLogCheckPointEvent(BinLogEvent):
@@ -214,12 +308,23 @@ class MariadbBinLogCheckPointEvent(BinLogEvent):
     :ivar filename: str - The name of the file saved at the checkpoint.
     """
 
+    __slots__ = ("_filename_bytes", "_filename")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super(MariadbBinLogCheckPointEvent, self).__init__(
             from_packet, event_size, table_map, ctl_connection, **kwargs
         )
         filename_length = self.packet.read_uint32()
-        self.filename = self.packet.read(filename_length).decode()
+        self._filename_bytes = self.packet.read(filename_length)
+
+    @property
+    def filename(self):
+        try:
+            return self._filename
+        except AttributeError:
+            pass
+        self._filename = self._filename_bytes.decode()
+        return self._filename
 
     def _dump(self):
         print(f"Filename: {self.filename}")
@@ -234,57 +339,77 @@ class MariadbAnnotateRowsEvent(BinLogEvent):
     :ivar sql_statement: str - The SQL statement
     """
 
+    __slots__ = ("_sql_statement_bytes", "_sql_statement")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
-        self.sql_statement = self.packet.read(event_size)
+        self._sql_statement_bytes = self.packet.read(event_size)
+
+    @property
+    def sql_statement(self):
+        # most consumers never look at the annotation, decode it on first access
+        try:
+            return self._sql_statement
+        except AttributeError:
+            pass
+        decode_errors = "ignore" if self._ignore_decode_errors else "strict"
+        self._sql_statement = self._sql_statement_bytes.decode(errors=decode_errors)
+        return self._sql_statement
 
     def _dump(self):
         super()._dump()
         print(f"SQL statement : {self.sql_statement}")
 
 
+class MariadbGtidObject(object):
+    """
+    Information class of elements in GTID list
+
+    An element is only a (domain_id, server_id, gtid_seq_no) triple unpacked
+    by the list event, so it is not a BinLogEvent itself.
+    """
+
+    __slots__ = ("domain_id", "server_id", "gtid_seq_no", "gtid")
+
+    def __init__(self, domain_id, server_id, gtid_seq_no):
+        self.domain_id = domain_id
+        self.server_id = server_id
+        self.gtid_seq_no = gtid_seq_no
+        self.gtid = f"{domain_id}-{server_id}-{gtid_seq_no}"
+
+
+# Kept for backward compatibility with the misspelled name
+MariadbGtidObejct = MariadbGtidObject
+
+
 class MariadbGtidListEvent(BinLogEvent):
     """
     GTID List event
     https://mariadb.com/kb/en/gtid_list_event/
 
     :ivar gtid_length: int - Number of GTIDs
-    :ivar gtid_list: list - list of 'MariadbGtidObejct'
+    :ivar gtid_list: list - list of 'MariadbGtidObject'
 
-    'MariadbGtidObejct' Attributes:
+    'MariadbGtidObject' Attributes:
         domain_id: Replication Domain ID
         server_id: Server_ID
         gtid_seq_no: GTID sequence
         gtid: 'domain_id'+ 'server_id' + 'gtid_seq_no'
     """
 
+    __slots__ = ("gtid_length", "gtid_list")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super(MariadbGtidListEvent, self).__init__(
             from_packet, event_size, table_map, ctl_connection, **kwargs
         )
 
-        class MariadbGtidObejct(BinLogEvent):
-            """
-            Information class of elements in GTID list
-            """
-
-            def __init__(
-                self, from_packet, event_size, table_map, ctl_connection, **kwargs
-            ):
-                super(MariadbGtidObejct, self).__init__(
-                    from_packet, event_size, table_map, ctl_connection, **kwargs
-                )
-                self.domain_id = self.packet.read_uint32()
-                self.server_id = self.packet.read_uint32()
-                self.gtid_seq_no = self.packet.read_uint64()
-                self.gtid = f"{self.domain_id}-{self.server_id}-{self.gtid_seq_no}"
-
         self.gtid_length = self.packet.read_uint32()
+        # elements are fixed size, unpack all of them in place from one view
+        elements = self.packet.read_view(self.gtid_length * _GTID_LIST_ELEMENT.size)
         self.gtid_list = [
-            MariadbGtidObejct(
-                from_packet, event_size, table_map, ctl_connection, **kwargs
-            )
-            for i in range(self.gtid_length)
+            MariadbGtidObject(*element)
+            for element in _GTID_LIST_ELEMENT.iter_unpack(elements)
         ]
 
 
@@ -299,15 +424,19 @@ class RotateEvent(BinLogEvent):
     :ivar next_binlog: str - Name of next binlog file
     """
 
+    __slots__ = ("position", "next_binlog")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
-        self.position = struct.unpack("<Q", self.packet.read(8))[0]
-        self.next_binlog = self.packet.read(event_size - 8).decode()
+        self.position = self.packet.read_uint64()
+        self.next_binlog = sys.intern(self.packet.read(event_size - 8).decode())
 
     def dump(self):
-        print(f"=== {self.__class__.__name__} ===")
-        print(f"Position: {self.position}")
-        print(f"Next binlog file: {self.next_binlog}")
+        print(
+            f"=== {self.__class__.__name__} ===\n"
+            f"Position: {self.position}\n"
+            f"Next binlog file: {self.next_binlog}"
+        )
         print()
 
 
@@ -323,15 +452,20 @@ class XAPrepareEvent(BinLogEvent):
     :ivar xid: serialized XID representation of XA transaction (xid_gtrid + xid_bqual)
     """
 
+    __slots__ = ("one_phase", "xid_format_id", "xid_gtrid", "xid_bqual")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
 
         # one_phase is True: XA COMMIT ... ONE PHASE
         # one_phase is False: XA PREPARE
-        self.one_phase = self.packet.read(1) != b"\x00"
-        self.xid_format_id = struct.unpack("<I", self.packet.read(4))[0]
-        gtrid_length = struct.unpack("<I", self.packet.read(4))[0]
-        bqual_length = struct.unpack("<I", self.packet.read(4))[0]
+        (
+            one_phase,
+            self.xid_format_id,
+            gtrid_length,
+            bqual_length,
+        ) = self.packet.unpack_from(_XA_PREPARE_HEADER)
+        self.one_phase = one_phase != 0
         self.xid_gtrid = self.packet.read(gtrid_length)
         self.xid_bqual = self.packet.read(bqual_length)
 
@@ -340,9 +474,11 @@ class XAPrepareEvent(BinLogEvent):
         return self.xid_gtrid.decode() + self.xid_bqual.decode()
 
     def _dump(self):
-        print(f"One phase: {self.one_phase}")
-        print(f"XID formatID: {self.xid_format_id}")
-        print(f"XID: {self.xid}")
+        print(
+            f"One phase: {self.one_phase}\n"
+            f"XID formatID: {self.xid_format_id}\n"
+            f"XID: {self.xid}"
+        )
 
 
 class FormatDescriptionEvent(BinLogEvent):
@@ -356,20 +492,23 @@ class FormatDescriptionEvent(BinLogEvent):
     :ivar mysql_version_str: str - Server's MySQL version in string format.
     """
 
+    __slots__ = ("binlog_version", "mysql_version_str")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
-        self.binlog_version = struct.unpack("<H", self.packet.read(2))
+        self.binlog_version = self.packet.read_uint16()
         self.mysql_version_str = self.packet.read(50).rstrip(b"\0").decode()
-        numbers = self.mysql_version_str.split("-")[0]
-        self.mysql_version = tuple(map(int, numbers.split(".")))
+        self.mysql_version = _parse_mysql_version(self.mysql_version_str)
 
     def _dump(self):
-        print(f"Binlog version: {self.binlog_version}")
-        print(f"MySQL version: {self.mysql_version_str}")
+        print(
+            f"Binlog version: {self.binlog_version}\n"
+            f"MySQL version: {self.mysql_version_str}"
+        )
 
 
 class StopEvent(BinLogEvent):
-    pass
+    __slots__ = ()
 
 
 class XidEvent(BinLogEvent):
@@ -381,9 +520,11 @@ class XidEvent(BinLogEvent):
     :ivar xid: uint - Transaction ID for 2 Phase Commit.
     """
 
+    __slots__ = ("xid",)
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
-        self.xid = struct.unpack("<Q", self.packet.read(8))[0]
+        (self.xid,) = self.packet.unpack_from(_UINT64)
 
     def _dump(self):
         super()._dump()
@@ -414,13 +555,25 @@ class HeartbeatLogEvent(BinLogEvent):
     :ivar ident: Name of the current binlog
     """
 
+    __slots__ = ("_ident_bytes", "_ident")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
-        self.ident = self.packet.read(event_size).decode()
+        self._ident_bytes = self.packet.read(event_size)
+
+    @property
+    def ident(self):
+        # heartbeats come for every skipped event, decode the name on demand
+        try:
+            return self._ident
+        except AttributeError:
+            pass
+        self._ident = sys.intern(self._ident_bytes.decode())
+        return self._ident
 
     def _dump(self):
         super()._dump()
-        print(f"Current binlog: {self.indent}")
+        print(f"Current binlog: {self.ident}")
 
 
 class QueryEvent(BinLogEvent):
@@ -438,123 +591,206 @@ class QueryEvent(BinLogEvent):
     :ivar query: str - The query executed.
     """
 
+    __slots__ = (
+        "slave_proxy_id",
+        "execution_time",
+        "schema_length",
+        "error_code",
+        "status_vars_length",
+        "schema",
+        "query",
+        "flags2",
+        "sql_mode",
+        "auto_increment_increment",
+        "auto_increment_offset",
+        "character_set_client",
+        "collation_connection",
+        "collation_server",
+        "time_zone",
+        "catalog_nz_code",
+        "lc_time_names_number",
+        "charset_database_number",
+        "table_map_for_update",
+        "user",
+        "host",
+        "mts_accessed_db_names",
+        "microseconds",
+        "explicit_defaults_ts",
+        "ddl_xid",
+        "default_collation_for_utf8mb4_number",
+        "sql_require_primary_key",
+        "default_table_encryption",
+        "hrnow",
+        "xid",
+    )
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
+        packet = self.packet
 
         # Post-header
-        self.slave_proxy_id = self.packet.read_uint32()
-        self.execution_time = self.packet.read_uint32()
-        self.schema_length = struct.unpack("!B", self.packet.read(1))[0]
-        self.error_code = self.packet.read_uint16()
-        self.status_vars_length = self.packet.read_uint16()
+        (
+            self.slave_proxy_id,
+            self.execution_time,
+            self.schema_length,
+            self.error_code,
+            self.status_vars_length,
+        ) = packet.unpack_from(_QUERY_POST_HEADER)
 
         # Payload
-        status_vars_end_pos = self.packet.read_bytes + self.status_vars_length
-        while self.packet.read_bytes < status_vars_end_pos:
+        # bind the loop's lookups once, status variables are parsed one by one
+        read_key = packet.read_uint8
+        dispatch = self._status_vars_dispatch
+        status_vars_end_pos = packet.read_bytes + self.status_vars_length
+        while packet.read_bytes < status_vars_end_pos:
             # read KEY for status variable
-            status_vars_key = self.packet.read_uint8()
+            read_value = dispatch[read_key()]
+            if read_value is None:
+                raise StatusVariableMismatch
             # read VALUE for status variable
-            self._read_status_vars_value_for_key(status_vars_key)
-
-        self.schema = self.packet.read(self.schema_length)
-        self.packet.advance(1)
-        query = self.packet.read(
-            event_size - 13 - self.status_vars_length - self.schema_length - 1
-        )
-        self.query = query.decode("utf-8", errors="backslashreplace")
-        # string[EOF]    query
+            read_value(self)
+
+        # schema, a NUL byte and the query (string[EOF]) make up the rest of
+        # the event, take them as one view and copy out each field once
+        rest = packet.read_view(event_size - packet.read_bytes)
+        self.schema = bytes(rest[: self.schema_length])
+        query = bytes(rest[self.schema_length + 1 :])
+        # the error handler is only needed for invalid UTF-8, so try the
+        # plain decode first
+        try:
+            self.query = query.decode()
+        except UnicodeDecodeError:
+            self.query = query.decode("utf-8", errors="backslashreplace")
 
     def _dump(self):
         super()._dump()
-        print(f"Schema: {self.schema}" % (self.schema))
-        print(f"Execution time: {self.execution_time}")
-        print(f"Query: {self.query}")
+        print(
+            f"Schema: {self.schema}\n"
+            f"Execution time: {self.execution_time}\n"
+            f"Query: {self.query}"
+        )
+
+    def _read_flags2(self):  # 0x00
+        self.flags2 = self.packet.read_uint32()
+
+    def _read_sql_mode(self):  # 0x01
+        self.sql_mode = self.packet.read_uint64()
+
+    def _read_nothing(self):
+        # Q_CATALOG_CODE, Q_MASTER_DATA_WRITTEN_CODE, Q_COMMIT_TS, Q_COMMIT_TS2
+        pass
+
+    def _read_auto_increment(self):  # 0x03
+        self.auto_increment_increment = self.packet.read_uint16()
+        self.auto_increment_offset = self.packet.read_uint16()
+
+    def _read_charset(self):  # 0x04
+        self.character_set_client = self.packet.read_uint16()
+        self.collation_connection = self.packet.read_uint16()
+        self.collation_server = self.packet.read_uint16()
+
+    def _read_time_zone(self):  # 0x05
+        time_zone_len = self.packet.read_uint8()
+        if time_zone_len:
+            self.time_zone = self.packet.read(time_zone_len)
+
+    def _read_catalog_nz(self):  # 0x06
+        catalog_len = self.packet.read_uint8()
+        if catalog_len:
+            self.catalog_nz_code = self.packet.read(catalog_len)
 
-    def _read_status_vars_value_for_key(self, key):
-        """parse status variable VALUE for given KEY
+    def _read_lc_time_names(self):  # 0x07
+        self.lc_time_names_number = self.packet.read_uint16()
 
-        A status variable in query events is a sequence of status KEY-VALUE pairs.
-        Parsing logic from mysql-server source code edited by dongwook-chan
-        https://github.com/mysql/mysql-server/blob/beb865a960b9a8a16cf999c323e46c5b0c67f21f/libbinlogevents/src/statement_events.cpp#L181-L336
+    def _read_charset_database(self):  # 0x08
+        self.charset_database_number = self.packet.read_uint16()
 
-        :ivar key: key for status variable
+    def _read_table_map_for_update(self):  # 0x09
+        self.table_map_for_update = self.packet.read_uint64()
+
+    def _read_invoker(self):  # 0x0B
+        user_len = self.packet.read_uint8()
+        if user_len:
+            self.user = self.packet.read(user_len)
+        host_len = self.packet.read_uint8()
+        if host_len:
+            self.host = self.packet.read(host_len)
+
+    def _read_updated_db_names(self):  # 0x0C
+        mts_accessed_dbs = self.packet.read_uint8()
         """
-        if key == Q_FLAGS2_CODE:  # 0x00
-            self.flags2 = self.packet.read_uint32()
-        elif key == Q_SQL_MODE_CODE:  # 0x01
-            self.sql_mode = self.packet.read_uint64()
-        elif key == Q_CATALOG_CODE:  # 0x02 for MySQL 5.0.x
-            pass
-        elif key == Q_AUTO_INCREMENT:  # 0x03
-            self.auto_increment_increment = self.packet.read_uint16()
-            self.auto_increment_offset = self.packet.read_uint16()
-        elif key == Q_CHARSET_CODE:  # 0x04
-            self.character_set_client = self.packet.read_uint16()
-            self.collation_connection = self.packet.read_uint16()
-            self.collation_server = self.packet.read_uint16()
-        elif key == Q_TIME_ZONE_CODE:  # 0x05
-            time_zone_len = self.packet.read_uint8()
-            if time_zone_len:
-                self.time_zone = self.packet.read(time_zone_len)
-        elif key == Q_CATALOG_NZ_CODE:  # 0x06
-            catalog_len = self.packet.read_uint8()
-            if catalog_len:
-                self.catalog_nz_code = self.packet.read(catalog_len)
-        elif key == Q_LC_TIME_NAMES_CODE:  # 0x07
-            self.lc_time_names_number = self.packet.read_uint16()
-        elif key == Q_CHARSET_DATABASE_CODE:  # 0x08
-            self.charset_database_number = self.packet.read_uint16()
-        elif key == Q_TABLE_MAP_FOR_UPDATE_CODE:  # 0x09
-            self.table_map_for_update = self.packet.read_uint64()
-        elif key == Q_MASTER_DATA_WRITTEN_CODE:  # 0x0A
-            pass
-        elif key == Q_INVOKER:  # 0x0B
-            user_len = self.packet.read_uint8()
-            if user_len:
-                self.user = self.packet.read(user_len)
-            host_len = self.packet.read_uint8()
-            if host_len:
-                self.host = self.packet.read(host_len)
-        elif key == Q_UPDATED_DB_NAMES:  # 0x0C
-            mts_accessed_dbs = self.packet.read_uint8()
-            """
-            mts_accessed_dbs < 254:
-                `mts_accessed_dbs` is equal to the number of dbs
-                accessed by the query event.
-            mts_accessed_dbs == 254:
-                This is the case where the number of dbs accessed
-                is 1 and the name of the only db is ""
-                Since no further parsing required(empty name), return.
-            """
-            if mts_accessed_dbs == 254:
-                return
-            dbs = []
-            for i in range(mts_accessed_dbs):
-                db = self.packet.read_string()
-                dbs.append(db)
-            self.mts_accessed_db_names = dbs
-        elif key == Q_MICROSECONDS:  # 0x0D
-            self.microseconds = self.packet.read_uint24()
-        elif key == Q_COMMIT_TS:  # 0x0E
-            pass
-        elif key == Q_COMMIT_TS2:  # 0x0F
-            pass
-        elif key == Q_EXPLICIT_DEFAULTS_FOR_TIMESTAMP:  # 0x10
-            self.explicit_defaults_ts = self.packet.read_uint8()
-        elif key == Q_DDL_LOGGED_WITH_XID:  # 0x11
-            self.ddl_xid = self.packet.read_uint64()
-        elif key == Q_DEFAULT_COLLATION_FOR_UTF8MB4:  # 0x12
-            self.default_collation_for_utf8mb4_number = self.packet.read_uint16()
-        elif key == Q_SQL_REQUIRE_PRIMARY_KEY:  # 0x13
-            self.sql_require_primary_key = self.packet.read_uint8()
-        elif key == Q_DEFAULT_TABLE_ENCRYPTION:  # 0x14
-            self.default_table_encryption = self.packet.read_uint8()
-        elif key == Q_HRNOW:
-            self.hrnow = self.packet.read_uint24()
-        elif key == Q_XID:
-            self.xid = self.packet.read_uint64()
-        else:
-            raise StatusVariableMismatch
+        mts_accessed_dbs < 254:
+            `mts_accessed_dbs` is equal to the number of dbs
+            accessed by the query event.
+        mts_accessed_dbs == 254:
+            This is the case where the number of dbs accessed
+            is 1 and the name of the only db is ""
+            Since no further parsing required(empty name), return.
+        """
+        if mts_accessed_dbs == 254:
+            return
+        dbs = []
+        for i in range(mts_accessed_dbs):
+            db = self.packet.read_string()
+            dbs.append(db)
+        self.mts_accessed_db_names = dbs
+
+    def _read_microseconds(self):  # 0x0D
+        self.microseconds = self.packet.read_uint24()
+
+    def _read_explicit_defaults_ts(self):  # 0x10
+        self.explicit_defaults_ts = self.packet.read_uint8()
+
+    def _read_ddl_xid(self):  # 0x11
+        self.ddl_xid = self.packet.read_uint64()
+
+    def _read_default_collation_for_utf8mb4(self):  # 0x12
+        self.default_collation_for_utf8mb4_number = self.packet.read_uint16()
+
+    def _read_sql_require_primary_key(self):  # 0x13
+        self.sql_require_primary_key = self.packet.read_uint8()
+
+    def _read_default_table_encryption(self):  # 0x14
+        self.default_table_encryption = self.packet.read_uint8()
+
+    def _read_hrnow(self):  # 0x80
+        self.hrnow = self.packet.read_uint24()
+
+    def _read_xid(self):  # 0x81
+        self.xid = self.packet.read_uint64()
+
+    # A status variable in query events is a sequence of status KEY-VALUE
+    # pairs. Parsing logic from mysql-server source code edited by dongwook-chan
+    # https://github.com/mysql/mysql-server/blob/beb865a960b9a8a16cf999c323e46c5b0c67f21f/libbinlogevents/src/statement_events.cpp#L181-L336
+    # KEY -> reader of the matching VALUE, looked up once per status variable
+    _status_vars_readers = {
+        Q_FLAGS2_CODE: _read_flags2,
+        Q_SQL_MODE_CODE: _read_sql_mode,
+        Q_CATALOG_CODE: _read_nothing,  # for MySQL 5.0.x
+        Q_AUTO_INCREMENT: _read_auto_increment,
+        Q_CHARSET_CODE: _read_charset,
+        Q_TIME_ZONE_CODE: _read_time_zone,
+        Q_CATALOG_NZ_CODE: _read_catalog_nz,
+        Q_LC_TIME_NAMES_CODE: _read_lc_time_names,
+        Q_CHARSET_DATABASE_CODE: _read_charset_database,
+        Q_TABLE_MAP_FOR_UPDATE_CODE: _read_table_map_for_update,
+        Q_MASTER_DATA_WRITTEN_CODE: _read_nothing,
+        Q_INVOKER: _read_invoker,
+        Q_UPDATED_DB_NAMES: _read_updated_db_names,
+        Q_MICROSECONDS: _read_microseconds,
+        Q_COMMIT_TS: _read_nothing,
+        Q_COMMIT_TS2: _read_nothing,
+        Q_EXPLICIT_DEFAULTS_FOR_TIMESTAMP: _read_explicit_defaults_ts,
+        Q_DDL_LOGGED_WITH_XID: _read_ddl_xid,
+        Q_DEFAULT_COLLATION_FOR_UTF8MB4: _read_default_collation_for_utf8mb4,
+        Q_SQL_REQUIRE_PRIMARY_KEY: _read_sql_require_primary_key,
+        Q_DEFAULT_TABLE_ENCRYPTION: _read_default_table_encryption,
+        Q_HRNOW: _read_hrnow,
+        Q_XID: _read_xid,
+    }
+    # KEY is a single byte, so a 256-slot tuple indexed by KEY needs no bounds
+    # check and replaces the dict lookup in the status variables loop
+    _status_vars_dispatch = tuple(map(_status_vars_readers.get, range(256)))
 
 
 class BeginLoadQueryEvent(BinLogEvent):
@@ -566,6 +802,8 @@ class BeginLoadQueryEvent(BinLogEvent):
     :ivar block-data: data block about "LOAD DATA INFILE"
     """
 
+    __slots__ = ("file_id", "block_data")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
 
@@ -575,8 +813,7 @@ class BeginLoadQueryEvent(BinLogEvent):
 
     def _dump(self):
         super()._dump()
-        print(f"File id: {self.file_id}")
-        print(f"Block data: {self.block_data}")
+        print(f"File id: {self.file_id}\nBlock data: {self.block_data}")
 
 
 class ExecuteLoadQueryEvent(BinLogEvent):
@@ -597,33 +834,47 @@ class ExecuteLoadQueryEvent(BinLogEvent):
     :ivar dup_handling_flags: int - How LOAD DATA INFILE handles duplicated data (0x0: error, 0x1: ignore, 0x2: replace)
     """
 
+    __slots__ = (
+        "slave_proxy_id",
+        "execution_time",
+        "schema_length",
+        "error_code",
+        "status_vars_length",
+        "file_id",
+        "start_pos",
+        "end_pos",
+        "dup_handling_flags",
+    )
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
 
         # Post-header
-        self.slave_proxy_id = self.packet.read_uint32()
-        self.execution_time = self.packet.read_uint32()
-        self.schema_length = self.packet.read_uint8()
-        self.error_code = self.packet.read_uint16()
-        self.status_vars_length = self.packet.read_uint16()
-
-        # Payload
-        self.file_id = self.packet.read_uint32()
-        self.start_pos = self.packet.read_uint32()
-        self.end_pos = self.packet.read_uint32()
-        self.dup_handling_flags = self.packet.read_uint8()
+        (
+            self.slave_proxy_id,
+            self.execution_time,
+            self.schema_length,
+            self.error_code,
+            self.status_vars_length,
+            self.file_id,
+            self.start_pos,
+            self.end_pos,
+            self.dup_handling_flags,
+        ) = self.packet.unpack_from(_EXECUTE_LOAD_QUERY_POST_HEADER)
 
     def _dump(self):
         super(ExecuteLoadQueryEvent, self)._dump()
-        print(f"Slave proxy id: {self.slave_proxy_id}")
-        print(f"Execution time: {self.execution_time}")
-        print(f"Schema length: {self.schema_length}")
-        print(f"Error code: {self.error_code}")
-        print(f"Status vars length: {self.status_vars_length}")
-        print(f"File id: {self.file_id}")
-        print(f"Start pos: {self.start_pos}")
-        print(f"End pos: {self.end_pos}")
-        print(f"Dup handling flags: {self.dup_handling_flags}")
+        print(
+            f"Slave proxy id: {self.slave_proxy_id}\n"
+            f"Execution time: {self.execution_time}\n"
+            f"Schema length: {self.schema_length}\n"
+            f"Error code: {self.error_code}\n"
+            f"Status vars length: {self.status_vars_length}\n"
+            f"File id: {self.file_id}\n"
+            f"Start pos: {self.start_pos}\n"
+            f"End pos: {self.end_pos}\n"
+            f"Dup handling flags: {self.dup_handling_flags}"
+        )
 
 
 class IntvarEvent(BinLogEvent):
@@ -636,17 +887,17 @@ class IntvarEvent(BinLogEvent):
     :ivar value: int - The value of the variable
     """
 
+    __slots__ = ("type", "value")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
 
         # Payload
-        self.type = self.packet.read_uint8()
-        self.value = self.packet.read_uint32()
+        self.type, self.value = self.packet.unpack_from(_INTVAR)
 
     def _dump(self):
         super()._dump()
-        print(f"type: {self.type}")
-        print(f"Value: {self.value}")
+        print(f"type: {self.type}\nValue: {self.value}")
 
 
 class RandEvent(BinLogEvent):
@@ -661,26 +912,16 @@ class RandEvent(BinLogEvent):
     :ivar seed2: int - value for the second seed
     """
 
+    __slots__ = ("seed1", "seed2")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
         # Payload
-        self._seed1 = self.packet.read_uint64()
-        self._seed2 = self.packet.read_uint64()
-
-    @property
-    def seed1(self):
-        """Get the first seed value"""
-        return self._seed1
-
-    @property
-    def seed2(self):
-        """Get the second seed value"""
-        return self._seed2
+        self.seed1, self.seed2 = self.packet.unpack_from(_RAND_SEEDS)
 
     def _dump(self):
         super()._dump()
-        print(f"seed1: {self.seed1}")
-        print(f"seed2: {self.seed2}")
+        print(f"seed1: {self.seed1}\nseed2: {self.seed2}")
 
 
 class UserVarEvent(BinLogEvent):
@@ -697,104 +938,118 @@ class UserVarEvent(BinLogEvent):
     :ivar flags: int - Extra flags associated with the user variable
     """
 
+    __slots__ = (
+        "name_len",
+        "name",
+        "is_null",
+        "value",
+        "flags",
+        "temp_value_buffer",
+        "type",
+        "charset",
+        "value_len",
+        "precision",
+        "decimals",
+    )
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super(UserVarEvent, self).__init__(
             from_packet, event_size, table_map, ctl_connection, **kwargs
         )
 
         # Payload
-        self.name_len: int = self.packet.read_uint32()
-        self.name: str = self.packet.read(self.name_len).decode()
-        self.is_null: int = self.packet.read_uint8()
-        self.type_to_codes_and_method: dict = {
-            0x00: ["STRING_RESULT", self._read_string],
-            0x01: ["REAL_RESULT", self._read_real],
-            0x02: ["INT_RESULT", self._read_int],
-            0x03: ["ROW_RESULT", self._read_default],
-            0x04: ["DECIMAL_RESULT", self._read_decimal],
-        }
-
+        packet = self.packet
+        self.name_len: int = packet.read_uint32()
+        self.name: str = packet.read(self.name_len).decode()
+        self.is_null: int = packet.read_uint8()
         self.value: Optional[Union[str, float, int, decimal.Decimal]] = None
-        self.flags: Optional[int] = None
-        self.temp_value_buffer: Union[bytes, memoryview] = b""
 
         if not self.is_null:
-            self.type: int = self.packet.read_uint8()
-            self.charset: int = self.packet.read_uint32()
-            self.value_len: int = self.packet.read_uint32()
-            self.temp_value_buffer: Union[bytes, memoryview] = self.packet.read(
+            self.type, self.charset, self.value_len = packet.unpack_from(
+                _USER_VAR_VALUE_HEADER
+            )
+            self.temp_value_buffer: Union[bytes, memoryview] = packet.read(
                 self.value_len
             )
-            self.flags: int = self.packet.read_uint8()
+            self.flags: Optional[int] = packet.read_uint8()
             self._set_value_from_temp_buffer()
         else:
-            self.type, self.charset, self.value_len, self.value, self.flags = (
-                None,
-                None,
-                None,
-                None,
-                None,
-            )
+            self.type = self.charset = self.value_len = self.flags = None
+            self.temp_value_buffer = b""
 
     def _set_value_from_temp_buffer(self):
         """
         Set the value from the temporary buffer based on the type code.
         """
         if self.temp_value_buffer:
-            type_code, read_method = self.type_to_codes_and_method.get(
-                self.type, ["UNKNOWN_RESULT", self._read_default]
+            # every reader takes (buffer, flags), whatever the type code
+            _, read_method = self.type_to_codes_and_method.get(
+                self.type, ("UNKNOWN_RESULT", UserVarEvent._read_default)
             )
-            if type_code == "INT_RESULT":
-                self.value = read_method(self.temp_value_buffer, self.flags)
-            else:
-                self.value = read_method(self.temp_value_buffer)
+            self.value = read_method(self, self.temp_value_buffer, self.flags)
 
-    def _read_string(self, buffer: bytes) -> str:
+    def _read_string(self, buffer: bytes, flags: Optional[int] = None) -> str:
         """
         Read string data.
         """
         return buffer.decode()
 
-    def _read_real(self, buffer: bytes) -> float:
+    def _read_real(self, buffer: bytes, flags: Optional[int] = None) -> float:
         """
         Read real data.
         """
-        return struct.unpack("<d", buffer)[0]
+        return _DOUBLE.unpack(buffer)[0]
 
     def _read_int(self, buffer: bytes, flags: int) -> int:
         """
         Read integer data.
         """
-        fmt = "<Q" if flags == 1 else "<q"
-        return struct.unpack(fmt, buffer)[0]
+        fmt = _UINT64 if flags == 1 else _INT64
+        return fmt.unpack(buffer)[0]
 
-    def _read_decimal(self, buffer: bytes) -> decimal.Decimal:
+    def _read_decimal(
+        self, buffer: bytes, flags: Optional[int] = None
+    ) -> decimal.Decimal:
         """
         Read decimal data.
         """
-        self.precision = self.temp_value_buffer[0]
-        self.decimals = self.temp_value_buffer[1]
-        raw_decimal = self.temp_value_buffer[2:]
+        self.precision = buffer[0]
+        self.decimals = buffer[1]
+        # slicing a view does not copy the digits
+        raw_decimal = memoryview(buffer)[2:]
         return parse_decimal_from_bytes(raw_decimal, self.precision, self.decimals)
 
-    def _read_default(self) -> bytes:
+    def _read_default(
+        self, buffer: Optional[bytes] = None, flags: Optional[int] = None
+    ) -> Optional[bytes]:
         """
         Read default data.
-        Used when the type is None.
+        Used for ROW_RESULT and unknown types, the value is kept as raw bytes.
         """
-        return self.packet.read(self.value_len)
+        return buffer
+
+    # type code -> (name, reader), shared by all instances
+    type_to_codes_and_method = {
+        0x00: ("STRING_RESULT", _read_string),
+        0x01: ("REAL_RESULT", _read_real),
+        0x02: ("INT_RESULT", _read_int),
+        0x03: ("ROW_RESULT", _read_default),
+        0x04: ("DECIMAL_RESULT", _read_decimal),
+    }
 
     def _dump(self) -> None:
         super(UserVarEvent, self)._dump()
-        print(f"User variable name: {self.name}")
-        print(f'Is NULL: {"Yes" if self.is_null else "No"}')
-        if not self.is_null:
+        if self.is_null:
+            print(f"User variable name: {self.name}\nIs NULL: Yes")
+        else:
             print(
-                f'Type: {self.type_to_codes_and_method.get(self.type, ["UNKNOWN_TYPE"])[0]}'
+                f"User variable name: {self.name}\n"
+                "Is NULL: No\n"
+                f'Type: {self.type_to_codes_and_method.get(self.type, ("UNKNOWN_TYPE",))[0]}\n'
+                f"Charset: {self.charset}\n"
+                f"Value: {self.value}\n"
+                f"Flags: {self.flags}"
             )
-            print(f"Charset: {self.charset}")
-            print(f"Value: {self.value}")
-            print(f"Flags: {self.flags}")
 
 
 class MariadbStartEncryptionEvent(BinLogEvent):
@@ -813,17 +1068,21 @@ class MariadbStartEncryptionEvent(BinLogEvent):
         nonce: Nonce (12 random bytes) of current binlog file.
     """
 
+    __slots__ = ("schema", "key_version", "nonce")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
 
-        self.schema = self.packet.read_uint8()
-        self.key_version = self.packet.read_uint32()
-        self.nonce = self.packet.read(12)
+        self.schema, self.key_version, self.nonce = self.packet.unpack_from(
+            _START_ENCRYPTION
+        )
 
     def _dump(self):
-        print(f"Schema: {self.schema}")
-        print(f"Key version: {self.key_version}")
-        print(f"Nonce: {self.nonce}")
+        print(
+            f"Schema: {self.schema}\n"
+            f"Key version: {self.key_version}\n"
+            f"Nonce: {self.nonce}"
+        )
 
 
 class RowsQueryLogEvent(BinLogEvent):
@@ -837,17 +1096,39 @@ class RowsQueryLogEvent(BinLogEvent):
     :ivar query: str - The executed SQL statement
     """
 
+    __slots__ = ("_query_bytes", "_query")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super(RowsQueryLogEvent, self).__init__(
             from_packet, event_size, table_map, ctl_connection, **kwargs
         )
-        self.query_length = self.packet.read_uint8()
-        self.query = self.packet.read(self.query_length).decode("utf-8")
+        packet = self.packet
+        query_length = packet.read_uint8()
+        self._query_bytes = packet.read(query_length)
+
+    @property
+    def query(self):
+        # row events are what consumers usually want, decode on first access
+        try:
+            return self._query
+        except AttributeError:
+            pass
+        try:
+            self._query = self._query_bytes.decode()
+        except UnicodeDecodeError:
+            self._query = self._query_bytes.decode("utf-8", errors="backslashreplace")
+        return self._query
+
+    @property
+    def query_length(self):
+        return len(self._query_bytes)
 
     def dump(self):
-        print(f"=== {self.__class__.__name__} ===")
-        print(f"Query length: {self.query_length}")
-        print(f"Query: {self.query}")
+        print(
+            f"=== {self.__class__.__name__} ===\n"
+            f"Query length: {self.query_length}\n"
+            f"Query: {self.query}"
+        )
 
 
 class NotImplementedEvent(BinLogEvent):
@@ -857,6 +1138,8 @@ class NotImplementedEvent(BinLogEvent):
     The event referencing this class skips parsing.
     """
 
+    __slots__ = ()
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
         self.packet.advance(event_size)
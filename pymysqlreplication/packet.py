@@ -41,6 +41,19 @@ JSONB_KEY_ENTRY_SIZE_LARGE = 2 + JSONB_LARGE_OFFSET_SIZE
 JSONB_VALUE_ENTRY_SIZE_SMALL = 1 + JSONB_SMALL_OFFSET_SIZE
 JSONB_VALUE_ENTRY_SIZE_LARGE = 1 + JSONB_LARGE_OFFSET_SIZE
 
+# OK value, timestamp, event_type, server_id, event_size, log_pos, flags
+EVENT_HEADER = struct.Struct("<cIBIIIH")
+
+# fixed width little endian integers, unpacked in place from the packet data
+_INT8 = struct.Struct("<b")
+_UINT8 = struct.Struct("<B")
+_INT16 = struct.Struct("<h")
+_UINT16 = struct.Struct("<H")
+_INT32 = struct.Struct("<i")
+_UINT32 = struct.Struct("<I")
+_INT64 = struct.Struct("<q")
+_UINT64 = struct.Struct("<Q")
+
 
 def is_json_inline_value(type: bytes, is_small: bool) -> bool:
     if type in [JSONB_TYPE_UINT16, JSONB_TYPE_INT16, JSONB_TYPE_LITERAL]:
@@ -244,7 +257,7 @@ class BinLogPacketWrapper(object):
         # server_id
         # log_pos
         # flags
-        unpack = struct.unpack("<cIBIIIH", self.packet.read(20))
+        unpack = EVENT_HEADER.unpack(self.packet.read(EVENT_HEADER.size))
 
         # Header
         self.timestamp = unpack[1]
@@ -298,6 +311,29 @@ class BinLogPacketWrapper(object):
                 return data + self.packet.read(size - len(data))
         return self.packet.read(size)
 
+    def unpack_from(self, fmt):
+        """Unpack a precompiled struct.Struct at the current position.
+
+        Values are decoded straight from the packet data, without slicing a
+        temporary bytes object when no data has been pushed back by unread.
+        """
+        if len(self.__data_buffer) > 0:
+            return fmt.unpack(self.read(fmt.size))
+        values = fmt.unpack_from(self.packet._data, self.packet._position)
+        self.packet.advance(fmt.size)
+        self.read_bytes += fmt.size
+        return values
+
+    def read_view(self, size):
+        """Read size bytes as a memoryview over the packet data, so that
+        they can be decoded without being copied first"""
+        if len(self.__data_buffer) > 0:
+            return memoryview(self.read(size))
+        position = self.packet._position
+        self.packet.advance(size)
+        self.read_bytes += size
+        return memoryview(self.packet._data)[position : position + size]
+
     def unread(self, data):
         """Push again data in data buffer. It's use when you want
         to extract a bit from a value a let the rest of the code normally
@@ -427,24 +463,27 @@ class BinLogPacketWrapper(object):
             res -= 0x1000000
         return res
 
+    def read_int8(self):
+        return self.unpack_from(_INT8)[0]
+
     def read_uint8(self):
-        return struct.unpack("<B", self.read(1))[0]
+        return self.unpack_from(_UINT8)[0]
 
     def read_int16(self):
-        return struct.unpack("<h", self.read(2))[0]
+        return self.unpack_from(_INT16)[0]
 
     def read_uint16(self):
-        return struct.unpack("<H", self.read(2))[0]
+        return self.unpack_from(_UINT16)[0]
 
     def read_uint24(self):
         a, b, c = struct.unpack("<BBB", self.read(3))
         return a + (b << 8) + (c << 16)
 
     def read_uint32(self):
-        return struct.unpack("<I", self.read(4))[0]
+        return self.unpack_from(_UINT32)[0]
 
     def read_int32(self):
-        return struct.unpack("<i", self.read(4))[0]
+        return self.unpack_from(_INT32)[0]
 
     def read_uint40(self):
         a, b = struct.unpack("<BI", self.read(5))
@@ -463,10 +502,10 @@ class BinLogPacketWrapper(object):
         return a + (b << 8) + (c << 24)
 
     def read_uint64(self):
-        return struct.unpack("<Q", self.read(8))[0]
+        return self.unpack_from(_UINT64)[0]
 
     def read_int64(self):
-        return struct.unpack("<q", self.read(8))[0]
+        return self.unpack_from(_INT64)[0]
 
     def unpack_uint16(self, n):
         return struct.unpack("<H", n[0:2])[0]
@@ -15,8 +15,37 @@ from .column import Column
 from .table import Table
 from .bitmap import BitCount, BitGet
 
+_FLOAT = struct.Struct("<f")
+_DOUBLE = struct.Struct("<d")
+_UINT16_PAIR = struct.Struct("<HH")
+_UINT8_PAIR = struct.Struct("<BB")
+
 
 class RowsEvent(BinLogEvent):
+    __slots__ = (
+        "__rows",
+        "__only_tables",
+        "__ignored_tables",
+        "__only_schemas",
+        "__ignored_schemas",
+        "__none_sources",
+        "table_id",
+        "primary_key",
+        "schema",
+        "table",
+        "flags",
+        "extra_data_length",
+        "extra_data_type",
+        "nbd_info_length",
+        "nbd_info_format",
+        "nbd_info",
+        "partition_id",
+        "source_partition_id",
+        "extra_data",
+        "number_of_columns",
+        "columns",
+    )
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
         self.__rows = None
@@ -67,32 +96,32 @@ class RowsEvent(BinLogEvent):
             or self.event_type == BINLOG.DELETE_ROWS_EVENT_V2
             or self.event_type == BINLOG.UPDATE_ROWS_EVENT_V2
         ):
-            self.flags, self.extra_data_length = struct.unpack(
-                "<HH", self.packet.read(4)
-            )
+            self.flags, self.extra_data_length = self.packet.unpack_from(_UINT16_PAIR)
             if self.extra_data_length > 2:
-                self.extra_data_type = struct.unpack("<B", self.packet.read(1))[0]
+                self.extra_data_type = self.packet.read_uint8()
 
                 # ndb information
                 if self.extra_data_type == 0:
-                    self.nbd_info_length, self.nbd_info_format = struct.unpack(
-                        "<BB", self.packet.read(2)
-                    )
+                    (
+                        self.nbd_info_length,
+                        self.nbd_info_format,
+                    ) = self.packet.unpack_from(_UINT8_PAIR)
                     self.nbd_info = self.packet.read(self.nbd_info_length - 2)
                 # partition information
                 elif self.extra_data_type == 1:
                     if self.event_type == BINLOG.UPDATE_ROWS_EVENT_V2:
-                        self.partition_id, self.source_partition_id = struct.unpack(
-                            "<HH", self.packet.read(4)
-                        )
+                        (
+                            self.partition_id,
+                            self.source_partition_id,
+                        ) = self.packet.unpack_from(_UINT16_PAIR)
                     else:
-                        self.partition_id = struct.unpack("<H", self.packet.read(2))[0]
+                        self.partition_id = self.packet.read_uint16()
 
                 # etc
                 else:
-                    self.extra_data = self.packet.read(self.extra_info_length - 3)
+                    self.extra_data = self.packet.read(self.extra_data_length - 3)
         else:
-            self.flags = struct.unpack("<H", self.packet.read(2))[0]
+            self.flags = self.packet.read_uint16()
 
         # Body
         self.number_of_columns = self.packet.read_length_coded_binary()
@@ -158,22 +187,19 @@ class RowsEvent(BinLogEvent):
 
         if column.type == FIELD_TYPE.TINY:
             if unsigned:
-                ret = struct.unpack("<B", self.packet.read(1))[0]
-                return ret
+                return self.packet.read_uint8()
             else:
-                return struct.unpack("<b", self.packet.read(1))[0]
+                return self.packet.read_int8()
         elif column.type == FIELD_TYPE.SHORT:
             if unsigned:
-                ret = struct.unpack("<H", self.packet.read(2))[0]
-                return ret
+                return self.packet.read_uint16()
             else:
-                return struct.unpack("<h", self.packet.read(2))[0]
+                return self.packet.read_int16()
         elif column.type == FIELD_TYPE.LONG:
             if unsigned:
-                ret = struct.unpack("<I", self.packet.read(4))[0]
-                return ret
+                return self.packet.read_uint32()
             else:
-                return struct.unpack("<i", self.packet.read(4))[0]
+                return self.packet.read_int32()
         elif column.type == FIELD_TYPE.INT24:
             if unsigned:
                 ret = self.packet.read_uint24()
@@ -181,9 +207,9 @@ class RowsEvent(BinLogEvent):
             else:
                 return self.packet.read_int24()
         elif column.type == FIELD_TYPE.FLOAT:
-            return struct.unpack("<f", self.packet.read(4))[0]
+            return self.packet.unpack_from(_FLOAT)[0]
         elif column.type == FIELD_TYPE.DOUBLE:
-            return struct.unpack("<d", self.packet.read(8))[0]
+            return self.packet.unpack_from(_DOUBLE)[0]
         elif column.type == FIELD_TYPE.VARCHAR or column.type == FIELD_TYPE.STRING:
             ret = (
                 self.__read_string(2, column)
@@ -508,10 +534,10 @@ class RowsEvent(BinLogEvent):
 
     def _dump(self):
         super()._dump()
-        print(f"Table: {self.schema}.{self.table}")
-        print(f"Affected columns: {self.number_of_columns}")
-        print(f"Changed rows: {len(self.rows)}")
         print(
+            f"Table: {self.schema}.{self.table}\n"
+            f"Affected columns: {self.number_of_columns}\n"
+            f"Changed rows: {len(self.rows)}\n"
             f"Column Name Information Flag: {self.table_map[self.table_id].column_name_flag}"
         )
 
@@ -537,6 +563,8 @@ class DeleteRowsEvent(RowsEvent):
     For each row you have a hash with a single key: values which contain the data of the removed line.
     """
 
+    __slots__ = ("columns_present_bitmap",)
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
         if self._processed:
@@ -554,17 +582,18 @@ class DeleteRowsEvent(RowsEvent):
 
     def _dump(self):
         super()._dump()
-        print("Values:")
+        # one print per event rather than one per column
+        lines = ["Values:"]
         for row in self.rows:
-            print("--")
-            for key in row["values"]:
-                none_source = (
-                    row["none_sources"][key] if key in row["none_sources"] else ""
-                )
+            lines.append("--")
+            none_sources = row["none_sources"]
+            for key, value in row["values"].items():
+                none_source = none_sources.get(key)
                 if none_source:
-                    print(f"* {key} : {row['values'][key]} ({none_source})")
+                    lines.append(f"* {key} : {value} ({none_source})")
                 else:
-                    print(f"* {key} : {row['values'][key]}")
+                    lines.append(f"* {key} : {value}")
+        print("\n".join(lines))
 
 
 class WriteRowsEvent(RowsEvent):
@@ -573,6 +602,8 @@ class WriteRowsEvent(RowsEvent):
     For each row you have a hash with a single key: values which contain the data of the new line.
     """
 
+    __slots__ = ("columns_present_bitmap",)
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
         if self._processed:
@@ -590,17 +621,18 @@ class WriteRowsEvent(RowsEvent):
 
     def _dump(self):
         super()._dump()
-        print("Values:")
+        # one print per event rather than one per column
+        lines = ["Values:"]
         for row in self.rows:
-            print("--")
-            for key in row["values"]:
-                none_source = (
-                    row["none_sources"][key] if key in row["none_sources"] else ""
-                )
+            lines.append("--")
+            none_sources = row["none_sources"]
+            for key, value in row["values"].items():
+                none_source = none_sources.get(key)
                 if none_source:
-                    print(f"* {key} : row['values'][key] ({none_source})")
+                    lines.append(f"* {key} : {value} ({none_source})")
                 else:
-                    print(f"* {key} : {row['values'][key]}")
+                    lines.append(f"* {key} : {value}")
+        print("\n".join(lines))
 
 
 class UpdateRowsEvent(RowsEvent):
@@ -614,6 +646,8 @@ class UpdateRowsEvent(RowsEvent):
     http://dev.mysql.com/doc/refman/5.6/en/replication-options-binary-log.html#sysvar_binlog_row_image
     """
 
+    __slots__ = ("columns_present_bitmap", "columns_present_bitmap2")
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
 
@@ -637,9 +671,9 @@ class UpdateRowsEvent(RowsEvent):
 
     def _dump(self):
         super()._dump()
-        print("Values:")
+        lines = ["Values:"]
         for row in self.rows:
-            print("--")
+            lines.append("--")
             for key in row["before_values"]:
                 if key in row["before_none_sources"]:
                     before_value_info = (
@@ -657,10 +691,30 @@ class UpdateRowsEvent(RowsEvent):
                 else:
                     after_value_info = row["after_values"][key]
 
-                print(f"*{key}:{before_value_info}=>{after_value_info}")
+                lines.append(f"*{key}:{before_value_info}=>{after_value_info}")
+        print("\n".join(lines))
 
 
 class OptionalMetaData:
+    __slots__ = (
+        "unsigned_column_list",
+        "default_charset_collation",
+        "charset_collation",
+        "column_charset",
+        "column_name_list",
+        "set_str_value_list",
+        "set_enum_str_value_list",
+        "geometry_type_list",
+        "simple_primary_key_list",
+        "primary_keys_with_prefix",
+        "enum_and_set_default_charset",
+        "enum_and_set_charset_collation",
+        "enum_and_set_default_column_charset_list",
+        "charset_collation_list",
+        "enum_and_set_collation_list",
+        "visibility_list",
+    )
+
     def __init__(self):
         self.unsigned_column_list = []
         self.default_charset_collation = None
@@ -680,20 +734,22 @@ class OptionalMetaData:
         self.visibility_list = []
 
     def dump(self):
-        print(f"=== {self.__class__.__name__} ===")
-        print(f"unsigned_column_list: {self.unsigned_column_list}")
-        print(f"default_charset_collation: {self.default_charset_collation}")
-        print(f"charset_collation: {self.charset_collation}")
-        print(f"column_charset: {self.column_charset}")
-        print(f"column_name_list: {self.column_name_list}")
-        print(f"set_str_value_list : {self.set_str_value_list}")
-        print(f"set_enum_str_value_list : {self.set_enum_str_value_list}")
-        print(f"geometry_type_list : {self.geometry_type_list}")
-        print(f"simple_primary_key_list: {self.simple_primary_key_list}")
-        print(f"primary_keys_with_prefix: {self.primary_keys_with_prefix}")
-        print(f"visibility_list: {self.visibility_list}")
-        print(f"charset_collation_list: {self.charset_collation_list}")
-        print(f"enum_and_set_collation_list: {self.enum_and_set_collation_list}")
+        print(
+            f"=== {self.__class__.__name__} ===\n"
+            f"unsigned_column_list: {self.unsigned_column_list}\n"
+            f"default_charset_collation: {self.default_charset_collation}\n"
+            f"charset_collation: {self.charset_collation}\n"
+            f"column_charset: {self.column_charset}\n"
+            f"column_name_list: {self.column_name_list}\n"
+            f"set_str_value_list : {self.set_str_value_list}\n"
+            f"set_enum_str_value_list : {self.set_enum_str_value_list}\n"
+            f"geometry_type_list : {self.geometry_type_list}\n"
+            f"simple_primary_key_list: {self.simple_primary_key_list}\n"
+            f"primary_keys_with_prefix: {self.primary_keys_with_prefix}\n"
+            f"visibility_list: {self.visibility_list}\n"
+            f"charset_collation_list: {self.charset_collation_list}\n"
+            f"enum_and_set_collation_list: {self.enum_and_set_collation_list}"
+        )
 
 
 class TableMapEvent(BinLogEvent):
@@ -702,6 +758,27 @@ class TableMapEvent(BinLogEvent):
     An end user of the lib should have no usage of this
     """
 
+    __slots__ = (
+        "__only_tables",
+        "__ignored_tables",
+        "__only_schemas",
+        "__ignored_schemas",
+        "__freeze_schema",
+        "__optional_meta_data",
+        "table_id",
+        "flags",
+        "schema_length",
+        "schema",
+        "table_length",
+        "table",
+        "column_count",
+        "columns",
+        "dbms",
+        "null_bitmask",
+        "table_obj",
+        "optional_metadata",
+    )
+
     def __init__(self, from_packet, event_size, table_map, ctl_connection, **kwargs):
         super().__init__(from_packet, event_size, table_map, ctl_connection, **kwargs)
 
@@ -718,13 +795,13 @@ class TableMapEvent(BinLogEvent):
             self._processed = False
             return
 
-        self.flags = struct.unpack("<H", self.packet.read(2))[0]
+        self.flags = self.packet.read_uint16()
 
         # Payload
-        self.schema_length = struct.unpack("!B", self.packet.read(1))[0]
+        self.schema_length = self.packet.read_uint8()
         self.schema = self.packet.read(self.schema_length).decode()
         self.packet.advance(1)
-        self.table_length = struct.unpack("!B", self.packet.read(1))[0]
+        self.table_length = self.packet.read_uint8()
         self.table = self.packet.read(self.table_length).decode()
 
         if self.__only_tables is not None and self.table not in self.__only_tables:
@@ -769,10 +846,12 @@ class TableMapEvent(BinLogEvent):
 
     def _dump(self):
         super()._dump()
-        print(f"Table id: {self.table_id}")
-        print(f"Schema: {self.schema}")
-        print(f"Table: {self.table}")
-        print(f"Columns: {self.column_count}")
+        print(
+            f"Table id: {self.table_id}\n"
+            f"Schema: {self.schema}\n"
+            f"Table: {self.table}\n"
+            f"Columns: {self.column_count}"
+        )
         if self.__optional_meta_data:
             self.optional_metadata.dump()
 
@@ -82,6 +82,16 @@ class TestBasicBinLogStreamReader(base.PyMySQLReplicationTestCase):
         # Rotate event
         self.assertIsInstance(self.stream.fetchone(), RotateEvent)
 
+    def test_format_description_event(self):
+        query = "CREATE TABLE test (id INT NOT NULL AUTO_INCREMENT, data VARCHAR (50) NOT NULL, PRIMARY KEY (id))"
+        self.execute(query)
+
+        self.assertIsInstance(self.stream.fetchone(), RotateEvent)
+
+        event = self.stream.fetchone()
+        self.assertIsInstance(event, FormatDescriptionEvent)
+        self.assertEqual(event.binlog_version, 4)
+
     """ `test_load_query_event` needs statement-based binlog
     def test_load_query_event(self):
         # prepare csv
@@ -595,6 +605,72 @@ class TestBasicBinLogStreamReader(base.PyMySQLReplicationTestCase):
         self.assertEqual(binlog_event.event._is_event_valid, True)
         self.assertNotEqual(wrong_event.event._is_event_valid, True)
 
+    def test_rows_event_other_extra_data(self):
+        self.stream.close()
+        self.stream = BinLogStreamReader(
+            self.database,
+            server_id=1024,
+            only_events=[TableMapEvent, WriteRowsEvent],
+        )
+        self.execute("CREATE TABLE test (id INT NOT NULL)")
+        self.execute("INSERT INTO test VALUES (1)")
+        self.execute("COMMIT")
+        table_map_event = self.stream.fetchone()
+        self.assertIsInstance(table_map_event, TableMapEvent)
+
+        # The server only sends ndb (0) or partition (1) extra data, build a
+        # WRITE_ROWS_EVENT_V2 carrying another extra data type by hand
+        body = (
+            # table_id and flags
+            table_map_event.table_id.to_bytes(6, "little")
+            + b"\x01\x00"
+            # extra_data_length, extra_data_type and 2 bytes of extra data
+            b"\x05\x00\x02ab"
+            # number of columns, columns present bitmap and null bitmap
+            b"\x01\x01\x00"
+            # id = 1
+            b"\x01\x00\x00\x00"
+        )
+        use_checksum = self.stream._BinLogStreamReader__use_checksum
+        event_size = 19 + len(body) + (4 if use_checksum else 0)
+        event_data = (
+            # OK value
+            b"\x00"
+            # Header
+            b"\x00\x00\x00\x00"
+            + WRITE_ROWS_EVENT_V2.to_bytes(1, "little")
+            + b"\x01\x00\x00\x00"
+            + event_size.to_bytes(4, "little")
+            + b"\x00\x00\x00\x00\x00\x00"
+            # Content
+            + body
+            # CRC 32, 4 Bytes, not verified
+            + (b"\x00\x00\x00\x00" if use_checksum else b"")
+        )
+
+        binlog_event = BinLogPacketWrapper(
+            MysqlPacket(event_data, 0),
+            self.stream.table_map,
+            self.stream._ctl_connection,
+            self.stream.mysql_version,
+            use_checksum,
+            self.stream._BinLogStreamReader__allowed_events_in_packet,
+            self.stream._BinLogStreamReader__only_tables,
+            self.stream._BinLogStreamReader__ignored_tables,
+            self.stream._BinLogStreamReader__only_schemas,
+            self.stream._BinLogStreamReader__ignored_schemas,
+            self.stream._BinLogStreamReader__freeze_schema,
+            self.stream._BinLogStreamReader__ignore_decode_errors,
+            self.stream._BinLogStreamReader__verify_checksum,
+            self.stream._BinLogStreamReader__optional_meta_data,
+        )
+        event = binlog_event.event
+        self.assertIsInstance(event, WriteRowsEvent)
+        self.assertEqual(event.extra_data_length, 5)
+        self.assertEqual(event.extra_data_type, 2)
+        self.assertEqual(event.extra_data, b"ab")
+        self.assertEqual(list(event.rows[0]["values"].values()), [1])
+
     def test_json_update(self):
         self.stream.close()
         self.stream = BinLogStreamReader(
@@ -883,7 +959,10 @@ class TestGtidBinLogStreamReader(base.PyMySQLReplicationTestCase):
         query = "COMMIT;"
         self.execute(query)
 
-        self.assertIsInstance(self.stream.fetchone(), PreviousGtidsEvent)
+        previous_gtids_event = self.stream.fetchone()
+        self.assertIsInstance(previous_gtids_event, PreviousGtidsEvent)
+        previous_gtids = previous_gtids_event._previous_gtids
+        self.assertEqual(str(GtidSet(previous_gtids)), previous_gtids)
         firstevent = self.stream.fetchone()
         self.assertIsInstance(firstevent, GtidEvent)
 
@@ -937,7 +1016,11 @@ class TestGtidBinLogStreamReader(base.PyMySQLReplicationTestCase):
 
         self.assertIsInstance(self.stream.fetchone(), RotateEvent)
         self.assertIsInstance(self.stream.fetchone(), FormatDescriptionEvent)
-        self.assertIsInstance(self.stream.fetchone(), PreviousGtidsEvent)
+        previous_gtids_event = self.stream.fetchone()
+        self.assertIsInstance(previous_gtids_event, PreviousGtidsEvent)
+        previous_gtids = previous_gtids_event._previous_gtids
+        self.assertEqual(str(GtidSet(previous_gtids)), previous_gtids)
+        self.assertIn(GtidSet(previous_gtids), GtidSet(gtid))
         self.assertIsInstance(self.stream.fetchone(), GtidEvent)
         event = self.stream.fetchone()
 
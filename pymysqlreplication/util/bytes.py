@@ -1,5 +1,6 @@
 import datetime
 import decimal
+import functools
 import struct
 import sys
 
@@ -41,11 +42,15 @@ def decode_variable_length(data: bytes):
     return 0, 0
 
 
-def parse_decimal_from_bytes(
-    raw_decimal: bytes, precision: int, decimals: int
-) -> decimal.Decimal:
+# MySQL DECIMAL holds up to 65 digits, scaling them must never round
+_DECIMAL_CONTEXT = decimal.Context(prec=65)
+
+
+@functools.lru_cache(maxsize=256)
+def _decimal_layout(precision: int, decimals: int):
     """
-    Parse decimal from bytes.
+    Byte layout of a DECIMAL(precision, decimals) binary encoding:
+    (head bytes, 4 bytes groups, tail bytes, 10 ** tail digits, total bytes)
     """
     digits_per_integer = 9
     compressed_bytes = [0, 1, 1, 2, 2, 3, 3, 4, 4, 4]
@@ -54,40 +59,44 @@ def parse_decimal_from_bytes(
     uncomp_integral, comp_integral = divmod(integral, digits_per_integer)
     uncomp_fractional, comp_fractional = divmod(decimals, digits_per_integer)
 
-    res = "-" if not raw_decimal[0] & 0x80 else ""
-    mask = -1 if res == "-" else 0
-    raw_decimal = bytearray([raw_decimal[0] ^ 0x80]) + raw_decimal[1:]
-
-    def decode_decimal_decompress_value(comp_indx, data, mask):
-        size = compressed_bytes[comp_indx]
-        if size > 0:
-            databuff = bytearray(data[:size])
-            for i in range(size):
-                databuff[i] = (databuff[i] ^ mask) & 0xFF
-            return size, int.from_bytes(databuff, byteorder="big")
-        return 0, 0
-
-    pointer, value = decode_decimal_decompress_value(comp_integral, raw_decimal, mask)
-    res += str(value)
-
-    for _ in range(uncomp_integral):
-        value = struct.unpack(">i", raw_decimal[pointer : pointer + 4])[0] ^ mask
-        res += f"{value:09}"
-        pointer += 4
+    head_bytes = compressed_bytes[comp_integral]
+    groups = uncomp_integral + uncomp_fractional
+    tail_bytes = compressed_bytes[comp_fractional]
+    total_bytes = head_bytes + 4 * groups + tail_bytes
+    return head_bytes, groups, tail_bytes, 10**comp_fractional, total_bytes
 
-    res += "."
 
-    for _ in range(uncomp_fractional):
-        value = struct.unpack(">i", raw_decimal[pointer : pointer + 4])[0] ^ mask
-        res += f"{value:09}"
-        pointer += 4
-
-    size, value = decode_decimal_decompress_value(
-        comp_fractional, raw_decimal[pointer:], mask
+def parse_decimal_from_bytes(
+    raw_decimal: bytes, precision: int, decimals: int
+) -> decimal.Decimal:
+    """
+    Parse decimal from bytes.
+    """
+    head_bytes, groups, tail_bytes, tail_scale, total_bytes = _decimal_layout(
+        precision, decimals
     )
-    if size > 0:
-        res += f"{value:0{comp_fractional}d}"
-    return decimal.Decimal(res)
+
+    # the whole encoding is read as one unsigned integer: the sign bit is
+    # cleared and negative values are flipped back with one XOR each
+    sign = 0 if raw_decimal[0] & 0x80 else 1
+    bits = total_bytes * 8
+    encoded = int.from_bytes(raw_decimal[:total_bytes], byteorder="big")
+    encoded ^= 1 << (bits - 1)
+    if sign:
+        encoded ^= (1 << bits) - 1
+
+    # digits are accumulated as one integer, base 10**9 per 4 bytes group,
+    # instead of being formatted to text and parsed again by Decimal
+    bits -= head_bytes * 8
+    value = encoded >> bits
+    for _ in range(groups):
+        bits -= 32
+        value = value * 1000000000 + ((encoded >> bits) & 0xFFFFFFFF)
+    if tail_bytes:
+        value = value * tail_scale + (encoded & ((1 << bits) - 1))
+
+    result = decimal.Decimal(value).scaleb(-decimals, _DECIMAL_CONTEXT)
+    return result.copy_negate() if sign else result
 
 
 def decode_decimal(data: bytes):